@@ -6,10 +6,12 @@ def simulate_order_flow():
     with app.app_context():
         print("\n--- Starting Order Flow Simulation ---\n")
 
-        # 1. Setup: Fetch Users and Menu Item
-        customer = User.query.filter_by(role='customer').first()
-        admin = User.query.filter_by(role='admin').first()
-        driver = User.query.filter_by(role='driver').first()
+        # 1. Setup: Fetch Users and Menu Item (one query for all three roles)
+        users = {u.role: u for u in User.query.filter(
+            User.role.in_(('customer', 'admin', 'driver'))).all()}
+        customer = users.get('customer')
+        admin = users.get('admin')
+        driver = users.get('driver')
         item = MenuItem.query.first()
 
         if not all([customer, admin, driver, item]):
@@ -52,32 +54,26 @@ def simulate_order_flow():
         print(f"[v] Customer {customer.name} placed Order #{new_order.id} with total {total} LE.")
 
         # 3. Step 2: Admin Updates Status
-        # Fetch order again to be safe (though we have the object)
-        order = Order.query.get(new_order.id)
-        
-        # 'New' -> 'Preparing'
+        # new_order is still tracked by the session; no need to refetch
+        order = new_order
+
+        # 'New' -> 'Preparing' -> 'Ready' (one commit for the admin step)
         order.status = 'Preparing'
-        db.session.commit()
-        
-        # 'Preparing' -> 'Ready'
         order.status = 'Ready'
         db.session.commit()
-        
+
         print(f"[v] Admin {admin.name} updated Order #{order.id} to 'Ready'.")
 
         # 4. Step 3: Driver Updates Status
-        # Driver picks up
+        # Driver picks up and delivers (one commit for the driver step)
         order.status = 'Out for Delivery'
-        db.session.commit()
-        
-        # Driver delivers
         order.status = 'Delivered'
         db.session.commit()
         
         print(f"[v] Driver {driver.name} picked up and Delivered Order #[{order.id}].")
 
-        # 5. Final Verification
-        final_order = Order.query.get(new_order.id)
+        # 5. Final Verification (same identity-map object, no extra query)
+        final_order = order
         print("-" * 40)
         print(f"[*] Final Order Status Verification: '{final_order.status}'")
         